@@ -4,80 +4,62 @@
 import os
 import sys
 from pathlib import Path
+from types import MappingProxyType
 import click
-from jinja2 import Template
 
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 
+# Static template metadata, built once and exposed read-only so every
+# caller shares the same object instead of allocating a fresh dict.
+_TEMPLATES = MappingProxyType({
+    "react": {
+        "name": "React App",
+        "description": "React application with Vite",
+    },
+    "python-cli": {
+        "name": "Python CLI",
+        "description": "Python CLI tool with Click",
+    },
+    "fastapi": {
+        "name": "FastAPI",
+        "description": "FastAPI web application",
+    },
+    "nextjs": {
+        "name": "Next.js",
+        "description": "Next.js application",
+    },
+    "node-api": {
+        "name": "Node.js API",
+        "description": "Node.js Express API",
+    },
+})
+
 
 def get_templates():
     """Get available templates."""
-    return {
-        "react": {
-            "name": "React App",
-            "description": "React application with Vite",
-        },
-        "python-cli": {
-            "name": "Python CLI",
-            "description": "Python CLI tool with Click",
-        },
-        "fastapi": {
-            "name": "FastAPI",
-            "description": "FastAPI web application",
-        },
-        "nextjs": {
-            "name": "Next.js",
-            "description": "Next.js application",
-        },
-        "node-api": {
-            "name": "Node.js API",
-            "description": "Node.js Express API",
-        },
-    }
+    return _TEMPLATES
 
 
-def create_project_structure(project_name, template, docker=False, testing=False, linting=False):
-    """Create project structure based on template."""
-    project_path = Path(project_name)
-    
-    if project_path.exists():
-        click.echo(f"Error: Directory '{project_name}' already exists!", err=True)
-        sys.exit(1)
-    
-    project_path.mkdir(parents=True)
-    
-    # Create basic structure
-    (project_path / "src").mkdir(exist_ok=True)
-    (project_path / "tests").mkdir(exist_ok=True)
-    
-    # Generate files based on template
-    if template == "react":
-        create_react_project(project_path, docker, testing, linting)
-    elif template == "python-cli":
-        create_python_cli_project(project_path, docker, testing, linting)
-    elif template == "fastapi":
-        create_fastapi_project(project_path, docker, testing, linting)
-    elif template == "nextjs":
-        create_nextjs_project(project_path, docker, testing, linting)
-    elif template == "node-api":
-        create_node_api_project(project_path, docker, testing, linting)
-    
-    click.echo(f"\n✅ Project '{project_name}' created successfully!")
-    click.echo(f"\n📁 Location: {project_path.absolute()}")
-    click.echo(f"\n🚀 Next steps:")
-    click.echo(f"   cd {project_name}")
-    if template in ["react", "nextjs", "node-api"]:
-        click.echo(f"   npm install")
-        click.echo(f"   npm run dev")
-    else:
-        click.echo(f"   pip install -r requirements.txt")
-        click.echo(f"   python -m src.main")
+# --- Template sources ---------------------------------------------------
+# The only substitution any template needs is the project name. Sources
+# with a {{ project_name }} placeholder are split on it once at import into
+# a tuple of pre-encoded literal segments (_compile); rendering is then a
+# single bytes join with the encoded name (_render). Sources with no
+# placeholder are pre-encoded bytes literals written out verbatim.
+_PLACEHOLDER = "{{ project_name }}"
 
 
-def create_react_project(path, docker, testing, linting):
-    """Create React project structure."""
-    # package.json
-    package_json = """{
+def _compile(src):
+    """Split template source into encoded segments around the placeholder."""
+    return tuple(part.encode() for part in src.split(_PLACEHOLDER))
+
+
+def _render(parts, name):
+    """Join precompiled template segments around the encoded project name."""
+    return name.join(parts)
+
+
+_REACT_PACKAGE_JSON = _compile("""{
   "name": "{{ project_name }}",
   "version": "0.1.0",
   "private": true,
@@ -98,21 +80,17 @@ def create_react_project(path, docker, testing, linting):
     "vite": "^4.4.0"
   }
 }
-"""
-    (path / "package.json").write_text(Template(package_json).render(project_name=path.name))
-    
-    # vite.config.js
-    vite_config = """import { defineConfig } from 'vite'
+""")
+
+_VITE_CONFIG = b"""import { defineConfig } from 'vite'
 import react from '@vitejs/plugin-react'
 
 export default defineConfig({
   plugins: [react()],
 })
 """
-    (path / "vite.config.js").write_text(vite_config)
-    
-    # index.html
-    index_html = """<!DOCTYPE html>
+
+_REACT_INDEX_HTML = _compile("""<!DOCTYPE html>
 <html lang="en">
   <head>
     <meta charset="UTF-8" />
@@ -124,11 +102,9 @@ export default defineConfig({
     <script type="module" src="/src/main.jsx"></script>
   </body>
 </html>
-"""
-    (path / "index.html").write_text(Template(index_html).render(project_name=path.name))
-    
-    # src/main.jsx
-    main_jsx = """import React from 'react'
+""")
+
+_REACT_MAIN_JSX = b"""import React from 'react'
 import ReactDOM from 'react-dom/client'
 import App from './App.jsx'
 import './index.css'
@@ -139,10 +115,8 @@ ReactDOM.createRoot(document.getElementById('root')).render(
   </React.StrictMode>,
 )
 """
-    (path / "src" / "main.jsx").write_text(main_jsx)
-    
-    # src/App.jsx
-    app_jsx = """import { useState } from 'react'
+
+_REACT_APP_JSX = _compile("""import { useState } from 'react'
 import './App.css'
 
 function App() {
@@ -161,11 +135,9 @@ function App() {
 }
 
 export default App
-"""
-    (path / "src" / "App.jsx").write_text(Template(app_jsx).render(project_name=path.name))
-    
-    # src/index.css
-    (path / "src" / "index.css").write_text("""* {
+""")
+
+_BASE_CSS = b"""* {
   margin: 0;
   padding: 0;
   box-sizing: border-box;
@@ -174,17 +146,15 @@ export default App
 body {
   font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif;
 }
-""")
-    
-    # src/App.css
-    (path / "src" / "App.css").write_text(""".App {
+"""
+
+_REACT_APP_CSS = b""".App {
   text-align: center;
   padding: 2rem;
 }
-""")
-    
-    # .gitignore
-    gitignore = """# Dependencies
+"""
+
+_REACT_GITIGNORE = b"""# Dependencies
 node_modules/
 dist/
 
@@ -203,41 +173,26 @@ build/
 # OS
 .DS_Store
 """
-    (path / ".gitignore").write_text(gitignore)
-    
-    # README.md
-    readme = """# {{ project_name }}
+
+_REACT_README = _compile("""# {{ project_name }}
 
 A React application built with Vite.
 
 ## Getting Started
 
-\`\`\`bash
+```bash
 npm install
 npm run dev
-\`\`\`
+```
 
 ## Build
 
-\`\`\`bash
+```bash
 npm run build
-\`\`\`
-"""
-    (path / "README.md").write_text(Template(readme).render(project_name=path.name))
-
+```
+""")
 
-def create_python_cli_project(path, docker, testing, linting):
-    """Create Python CLI project structure."""
-    # requirements.txt
-    reqs = ["click>=8.1.0"]
-    if testing:
-        reqs.append("pytest>=7.0.0")
-    if linting:
-        reqs.extend(["ruff>=0.1.0", "black>=23.0.0"])
-    (path / "requirements.txt").write_text("\n".join(reqs) + "\n")
-    
-    # src/main.py
-    main_py = """#!/usr/bin/env python3
+_PY_MAIN = _compile("""#!/usr/bin/env python3
 \"\"\"{{ project_name }} - CLI tool.\"\"\"
 
 import click
@@ -252,15 +207,9 @@ def main(name):
 
 if __name__ == '__main__':
     main()
-"""
-    (path / "src" / "main.py").write_text(Template(main_py).render(project_name=path.name))
-    
-    # src/__init__.py
-    (path / "src" / "__init__.py").write_text(f'"""{{ project_name }} package."""\n')
-    
-    # tests/test_main.py
-    if testing:
-        test_main = """import pytest
+""")
+
+_PY_CLI_TEST = b"""import pytest
 from src.main import main
 
 
@@ -268,11 +217,8 @@ def test_main():
     # Add your tests here
     assert True
 """
-        (path / "tests" / "test_main.py").write_text(test_main)
-        (path / "tests" / "__init__.py").write_text("")
-    
-    # .gitignore
-    gitignore = """# Python
+
+_PY_GITIGNORE = b"""# Python
 __pycache__/
 *.py[cod]
 *.so
@@ -290,40 +236,25 @@ venv/
 # OS
 .DS_Store
 """
-    (path / ".gitignore").write_text(gitignore)
-    
-    # README.md
-    readme = """# {{ project_name }}
+
+_PY_CLI_README = _compile("""# {{ project_name }}
 
 A Python CLI tool built with Click.
 
 ## Installation
 
-\`\`\`bash
+```bash
 pip install -r requirements.txt
-\`\`\`
+```
 
 ## Usage
 
-\`\`\`bash
+```bash
 python -m src.main --name "Your Name"
-\`\`\`
-"""
-    (path / "README.md").write_text(Template(readme).render(project_name=path.name))
-
+```
+""")
 
-def create_fastapi_project(path, docker, testing, linting):
-    """Create FastAPI project structure."""
-    # requirements.txt
-    reqs = ["fastapi>=0.100.0", "uvicorn[standard]>=0.23.0"]
-    if testing:
-        reqs.extend(["pytest>=7.0.0", "httpx>=0.24.0"])
-    if linting:
-        reqs.extend(["ruff>=0.1.0", "black>=23.0.0"])
-    (path / "requirements.txt").write_text("\n".join(reqs) + "\n")
-    
-    # src/main.py
-    main_py = """from fastapi import FastAPI
+_FASTAPI_MAIN = _compile("""from fastapi import FastAPI
 
 app = FastAPI(title="{{ project_name }}")
 
@@ -336,15 +267,9 @@ def read_root():
 @app.get("/health")
 def health_check():
     return {"status": "healthy"}
-"""
-    (path / "src" / "main.py").write_text(Template(main_py).render(project_name=path.name))
-    
-    # src/__init__.py
-    (path / "src" / "__init__.py").write_text("")
-    
-    # tests/test_main.py
-    if testing:
-        test_main = """from fastapi.testclient import TestClient
+""")
+
+_FASTAPI_TEST = b"""from fastapi.testclient import TestClient
 from src.main import app
 
 client = TestClient(app)
@@ -361,54 +286,27 @@ def test_health_check():
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
 """
-        (path / "tests" / "test_main.py").write_text(test_main)
-        (path / "tests" / "__init__.py").write_text("")
-    
-    # .gitignore
-    gitignore = """# Python
-__pycache__/
-*.py[cod]
-*.so
-.Python
-build/
-dist/
-*.egg-info/
-.venv/
-venv/
-
-# IDE
-.vscode/
-.idea/
 
-# OS
-.DS_Store
-"""
-    (path / ".gitignore").write_text(gitignore)
-    
-    # README.md
-    readme = """# {{ project_name }}
+_FASTAPI_README = _compile("""# {{ project_name }}
 
 A FastAPI web application.
 
 ## Installation
 
-\`\`\`bash
+```bash
 pip install -r requirements.txt
-\`\`\`
+```
 
 ## Usage
 
-\`\`\`bash
+```bash
 uvicorn src.main:app --reload
-\`\`\`
+```
 
 Visit http://localhost:8000/docs for API documentation.
-"""
-    (path / "README.md").write_text(Template(readme).render(project_name=path.name))
-    
-    if docker:
-        # Dockerfile
-        dockerfile = """FROM python:3.11-slim
+""")
+
+_DOCKERFILE = b"""FROM python:3.11-slim
 
 WORKDIR /app
 
@@ -419,21 +317,17 @@ COPY . .
 
 CMD ["uvicorn", "src.main:app", "--host", "0.0.0.0", "--port", "8000"]
 """
-        (path / "Dockerfile").write_text(dockerfile)
-        
-        # .dockerignore
-        (path / ".dockerignore").write_text("""__pycache__
+
+_DOCKERIGNORE = b"""__pycache__
 *.pyc
 .venv
 venv
 .git
 .gitignore
 README.md
-""")
-    
-    # docker-compose.yml
-    if docker:
-        docker_compose = """version: '3.8'
+"""
+
+_DOCKER_COMPOSE = b"""version: '3.8'
 
 services:
   app:
@@ -443,13 +337,8 @@ services:
     volumes:
       - .:/app
 """
-        (path / "docker-compose.yml").write_text(docker_compose)
 
-
-def create_nextjs_project(path, docker, testing, linting):
-    """Create Next.js project structure."""
-    # package.json
-    package_json = """{
+_NEXTJS_PACKAGE_JSON = _compile("""{
   "name": "{{ project_name }}",
   "version": "0.1.0",
   "private": true,
@@ -471,20 +360,17 @@ def create_nextjs_project(path, docker, testing, linting):
     "typescript": "^5.0.0"
   }
 }
-"""
-    (path / "package.json").write_text(Template(package_json).render(project_name=path.name))
-    
-    # next.config.js
-    (path / "next.config.js").write_text("""/** @type {import('next').NextConfig} */
+""")
+
+_NEXT_CONFIG = b"""/** @type {import('next').NextConfig} */
 const nextConfig = {
   reactStrictMode: true,
 }
 
 module.exports = nextConfig
-""")
-    
-    # tsconfig.json
-    (path / "tsconfig.json").write_text("""{
+"""
+
+_TSCONFIG = b"""{
   "compilerOptions": {
     "target": "es5",
     "lib": ["dom", "dom.iterable", "esnext"],
@@ -507,11 +393,9 @@ module.exports = nextConfig
   "include": ["next-env.d.ts", "**/*.ts", "**/*.tsx"],
   "exclude": ["node_modules"]
 }
-""")
-    
-    # app/layout.tsx
-    (path / "app").mkdir(exist_ok=True)
-    layout_tsx = """export const metadata = {
+"""
+
+_NEXTJS_LAYOUT_TSX = _compile("""export const metadata = {
   title: '{{ project_name }}',
   description: 'Generated by quick-scaffold',
 }
@@ -527,11 +411,9 @@ export default function RootLayout({
     </html>
   )
 }
-"""
-    (path / "app" / "layout.tsx").write_text(Template(layout_tsx).render(project_name=path.name))
-    
-    # app/page.tsx
-    page_tsx = """export default function Home() {
+""")
+
+_NEXTJS_PAGE_TSX = _compile("""export default function Home() {
   return (
     <main>
       <h1>{{ project_name }}</h1>
@@ -539,23 +421,9 @@ export default function RootLayout({
     </main>
   )
 }
-"""
-    (path / "app" / "page.tsx").write_text(Template(page_tsx).render(project_name=path.name))
-    
-    # app/globals.css
-    (path / "app" / "globals.css").write_text("""* {
-  margin: 0;
-  padding: 0;
-  box-sizing: border-box;
-}
-
-body {
-  font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif;
-}
 """)
-    
-    # .gitignore
-    gitignore = """# Dependencies
+
+_NEXTJS_GITIGNORE = b"""# Dependencies
 node_modules/
 .next/
 out/
@@ -571,29 +439,22 @@ out/
 # OS
 .DS_Store
 """
-    (path / ".gitignore").write_text(gitignore)
-    
-    # README.md
-    readme = """# {{ project_name }}
+
+_NEXTJS_README = _compile("""# {{ project_name }}
 
 A Next.js application.
 
 ## Getting Started
 
-\`\`\`bash
+```bash
 npm install
 npm run dev
-\`\`\`
+```
 
 Open [http://localhost:3000](http://localhost:3000) in your browser.
-"""
-    (path / "README.md").write_text(Template(readme).render(project_name=path.name))
-
+""")
 
-def create_node_api_project(path, docker, testing, linting):
-    """Create Node.js API project structure."""
-    # package.json
-    package_json = """{
+_NODE_PACKAGE_JSON = _compile("""{
   "name": "{{ project_name }}",
   "version": "0.1.0",
   "type": "module",
@@ -607,11 +468,9 @@ def create_node_api_project(path, docker, testing, linting):
   },
   "devDependencies": {}
 }
-"""
-    (path / "package.json").write_text(Template(package_json).render(project_name=path.name))
-    
-    # src/index.js
-    index_js = """import express from 'express';
+""")
+
+_NODE_INDEX_JS = b"""import express from 'express';
 
 const app = express();
 const PORT = process.env.PORT || 3000;
@@ -630,10 +489,8 @@ app.listen(PORT, () => {
   console.log(`Server running on http://localhost:${PORT}`);
 });
 """
-    (path / "src" / "index.js").write_text(index_js)
-    
-    # .gitignore
-    gitignore = """# Dependencies
+
+_NODE_GITIGNORE = b"""# Dependencies
 node_modules/
 
 # Environment
@@ -647,54 +504,252 @@ node_modules/
 # OS
 .DS_Store
 """
-    (path / ".gitignore").write_text(gitignore)
-    
-    # README.md
-    readme = """# {{ project_name }}
+
+_NODE_README = _compile("""# {{ project_name }}
 
 A Node.js Express API.
 
 ## Installation
 
-\`\`\`bash
+```bash
 npm install
-\`\`\`
+```
 
 ## Usage
 
-\`\`\`bash
+```bash
 npm run dev
-\`\`\`
+```
 
 Server will run on http://localhost:3000
-"""
-    (path / "README.md").write_text(Template(readme).render(project_name=path.name))
+""")
+
+# Opening siblings relative to a directory fd skips the kernel path walk
+# for every file in that directory; not every platform supports it.
+_HAS_DIR_FD = os.open in os.supports_dir_fd
+
+
+def _write_files(base, files):
+    """Write a batch of {relative path: contents} entries below *base*.
+
+    Uses raw os-level open/write/close instead of Path.write_text so each
+    file costs the bare syscalls without the TextIOWrapper layer. Where
+    the platform supports dir_fd, files sharing a directory are written
+    through a single open directory fd so the kernel resolves each
+    directory path only once.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    if not _HAS_DIR_FD:
+        for rel, data in files.items():
+            fd = os.open(str(base / rel), flags, 0o644)
+            try:
+                os.write(fd, data if isinstance(data, bytes) else data.encode())
+            finally:
+                os.close(fd)
+        return
+
+    by_dir = {}
+    for rel, data in files.items():
+        d, _, fname = rel.rpartition("/")
+        by_dir.setdefault(d, []).append((fname, data))
+
+    for d, entries in by_dir.items():
+        dir_fd = os.open(str(base / d) if d else str(base), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            for fname, data in entries:
+                fd = os.open(fname, flags, 0o644, dir_fd=dir_fd)
+                try:
+                    os.write(fd, data if isinstance(data, bytes) else data.encode())
+                finally:
+                    os.close(fd)
+        finally:
+            os.close(dir_fd)
+
+
+# Subdirectories each template actually populates. tests/ is added on
+# demand for the templates that can generate a test suite.
+_TEMPLATE_DIRS = {
+    "react": ("src",),
+    "python-cli": ("src",),
+    "fastapi": ("src",),
+    "nextjs": ("app",),
+    "node-api": ("src",),
+}
+
+
+def create_project_structure(project_name, template, docker=False, testing=False, linting=False, cwd=None):
+    """Create project structure based on template.
+
+    The project is created under *cwd* when given, otherwise relative to
+    the process working directory; passing cwd keeps callers (and tests)
+    from having to os.chdir around the call.
+    """
+    project_path = Path(cwd) / project_name if cwd is not None else Path(project_name)
+
+    # EAFP: mkdir raises FileExistsError itself, so one syscall both
+    # creates the root and detects a pre-existing directory.
+    try:
+        project_path.mkdir(parents=True)
+    except FileExistsError:
+        click.echo(f"Error: Directory '{project_name}' already exists!", err=True)
+        sys.exit(1)
+
+    # Create only the directories this template writes into; the root was
+    # just created empty, so the plain mkdirs cannot collide.
+    dirs = list(_TEMPLATE_DIRS[template])
+    if testing and template in ("python-cli", "fastapi"):
+        dirs.append("tests")
+    for d in dirs:
+        (project_path / d).mkdir()
+
+    # Generate files based on template
+    _HANDLERS[template](project_path, docker, testing, linting)
+
+    # Resolve the display location without Path.absolute(), whose getcwd
+    # syscall is only needed when the path is actually relative.
+    location = project_path if project_path.is_absolute() else Path(os.getcwd()) / project_path
+
+    # One buffered write to stdout instead of six separate echoes
+    if template in ("react", "nextjs", "node-api"):
+        next_steps = "   npm install\n   npm run dev"
+    else:
+        next_steps = "   pip install -r requirements.txt\n   python -m src.main"
+    click.echo(
+        f"\n✅ Project '{project_name}' created successfully!\n"
+        f"\n📁 Location: {location}\n"
+        f"\n🚀 Next steps:\n"
+        f"   cd {project_name}\n"
+        f"{next_steps}"
+    )
+
+
+def create_react_project(path, docker, testing, linting):
+    """Create React project structure."""
+    name = path.name.encode()
+    _write_files(path, {
+        "package.json": _render(_REACT_PACKAGE_JSON, name),
+        "vite.config.js": _VITE_CONFIG,
+        "index.html": _render(_REACT_INDEX_HTML, name),
+        "src/main.jsx": _REACT_MAIN_JSX,
+        "src/App.jsx": _render(_REACT_APP_JSX, name),
+        "src/index.css": _BASE_CSS,
+        "src/App.css": _REACT_APP_CSS,
+        ".gitignore": _REACT_GITIGNORE,
+        "README.md": _render(_REACT_README, name),
+    })
+
+
+def create_python_cli_project(path, docker, testing, linting):
+    """Create Python CLI project structure."""
+    # requirements.txt
+    reqs = ["click>=8.1.0"]
+    if testing:
+        reqs.append("pytest>=7.0.0")
+    if linting:
+        reqs.extend(["ruff>=0.1.0", "black>=23.0.0"])
+    name = path.name.encode()
+    files = {
+        "requirements.txt": "\n".join(reqs) + "\n",
+        "src/main.py": _render(_PY_MAIN, name),
+        "src/__init__.py": f'"""{path.name} package."""\n',
+        ".gitignore": _PY_GITIGNORE,
+        "README.md": _render(_PY_CLI_README, name),
+    }
+    if testing:
+        files["tests/test_main.py"] = _PY_CLI_TEST
+        files["tests/__init__.py"] = ""
+    _write_files(path, files)
+
+
+def create_fastapi_project(path, docker, testing, linting):
+    """Create FastAPI project structure."""
+    # requirements.txt
+    reqs = ["fastapi>=0.100.0", "uvicorn[standard]>=0.23.0"]
+    if testing:
+        reqs.extend(["pytest>=7.0.0", "httpx>=0.24.0"])
+    if linting:
+        reqs.extend(["ruff>=0.1.0", "black>=23.0.0"])
+    name = path.name.encode()
+    files = {
+        "requirements.txt": "\n".join(reqs) + "\n",
+        "src/main.py": _render(_FASTAPI_MAIN, name),
+        "src/__init__.py": "",
+        ".gitignore": _PY_GITIGNORE,
+        "README.md": _render(_FASTAPI_README, name),
+    }
+    if testing:
+        files["tests/test_main.py"] = _FASTAPI_TEST
+        files["tests/__init__.py"] = ""
+    if docker:
+        files["Dockerfile"] = _DOCKERFILE
+        files[".dockerignore"] = _DOCKERIGNORE
+        files["docker-compose.yml"] = _DOCKER_COMPOSE
+    _write_files(path, files)
+
+
+def create_nextjs_project(path, docker, testing, linting):
+    """Create Next.js project structure."""
+    name = path.name.encode()
+    _write_files(path, {
+        "package.json": _render(_NEXTJS_PACKAGE_JSON, name),
+        "next.config.js": _NEXT_CONFIG,
+        "tsconfig.json": _TSCONFIG,
+        "app/layout.tsx": _render(_NEXTJS_LAYOUT_TSX, name),
+        "app/page.tsx": _render(_NEXTJS_PAGE_TSX, name),
+        "app/globals.css": _BASE_CSS,
+        ".gitignore": _NEXTJS_GITIGNORE,
+        "README.md": _render(_NEXTJS_README, name),
+    })
+
+
+def create_node_api_project(path, docker, testing, linting):
+    """Create Node.js API project structure."""
+    name = path.name.encode()
+    _write_files(path, {
+        "package.json": _render(_NODE_PACKAGE_JSON, name),
+        "src/index.js": _NODE_INDEX_JS,
+        ".gitignore": _NODE_GITIGNORE,
+        "README.md": _render(_NODE_README, name),
+    })
+
+
+# Template name -> generator function, looked up once per invocation
+# instead of walking an if/elif chain.
+_HANDLERS = {
+    "react": create_react_project,
+    "python-cli": create_python_cli_project,
+    "fastapi": create_fastapi_project,
+    "nextjs": create_nextjs_project,
+    "node-api": create_node_api_project,
+}
+
+# Built once at import; main() reuses this instead of constructing a
+# Choice validator on every invocation.
+_TEMPLATE_CHOICE = click.Choice(list(_TEMPLATES))
 
 
 @click.command()
 @click.argument('project_name', required=False)
-@click.option('--template', '-t', type=click.Choice(['react', 'python-cli', 'fastapi', 'nextjs', 'node-api']), help='Project template')
+@click.option('--template', '-t', type=_TEMPLATE_CHOICE, help='Project template')
 @click.option('--docker', is_flag=True, help='Include Docker setup')
 @click.option('--testing', is_flag=True, help='Include testing framework')
 @click.option('--linting', is_flag=True, help='Include linting configuration')
 def main(project_name, template, docker, testing, linting):
     """Quick Scaffold - Generate project templates quickly."""
-    
-    templates = get_templates()
-    
+
     # Interactive mode if project_name not provided
     if not project_name:
         click.echo("🚀 Quick Scaffold - Project Template Generator\n")
         click.echo("Available templates:")
-        for key, info in templates.items():
+        for key, info in _TEMPLATES.items():
             click.echo(f"  {key:12} - {info['name']}: {info['description']}")
         click.echo()
-        
+
         project_name = click.prompt("Project name", type=str)
         if not template:
             template = click.prompt(
                 "Template",
-                type=click.Choice(list(templates.keys())),
+                type=_TEMPLATE_CHOICE,
                 default="python-cli"
             )
         if not docker:
@@ -703,15 +758,13 @@ def main(project_name, template, docker, testing, linting):
             testing = click.confirm("Include testing framework?", default=False)
         if not linting:
             linting = click.confirm("Include linting configuration?", default=False)
-    
+
     # Default template if not specified
     if not template:
         template = "python-cli"
-    
+
     create_project_structure(project_name, template, docker, testing, linting)
 
 
 if __name__ == '__main__':
     main()
-
-
@@ -3,7 +3,6 @@
 import pytest
 from pathlib import Path
 import tempfile
-import os
 import sys
 
 # Add src to path
@@ -23,9 +22,8 @@ def test_get_templates():
 def test_create_python_cli_project():
     """Test creating a Python CLI project."""
     with tempfile.TemporaryDirectory() as tmpdir:
-        os.chdir(tmpdir)
         project_name = "test-cli"
-        create_project_structure(project_name, "python-cli", docker=False, testing=True, linting=False)
+        create_project_structure(project_name, "python-cli", docker=False, testing=True, linting=False, cwd=Path(tmpdir))
         
         project_path = Path(tmpdir) / project_name
         assert project_path.exists()
@@ -39,9 +37,8 @@ def test_create_python_cli_project():
 def test_create_fastapi_project():
     """Test creating a FastAPI project."""
     with tempfile.TemporaryDirectory() as tmpdir:
-        os.chdir(tmpdir)
         project_name = "test-api"
-        create_project_structure(project_name, "fastapi", docker=True, testing=True, linting=False)
+        create_project_structure(project_name, "fastapi", docker=True, testing=True, linting=False, cwd=Path(tmpdir))
         
         project_path = Path(tmpdir) / project_name
         assert project_path.exists()